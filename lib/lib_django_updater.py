@@ -10,9 +10,13 @@ log = logging.getLogger(__name__)
 def check_for_django_update(incoming_text: str) -> bool:
     """
     Checks if the uv.lock unified diff indicates a Django version update.
+    Skips the line-by-line parse entirely when the diff never mentions django.
     Called by auto_updater.manage_update().
     """
     log.info('::: check_for_django_update ----------')
+    if 'django' not in incoming_text.lower():
+        log.info('ok / django not mentioned in diff; django-updated, ``False``')
+        return False
     updated, old_v, new_v = parse_uv_lock_version_change(incoming_text, 'django')
     if updated:
         log.info(f'ok / django version updated: {old_v} -> {new_v}')
@@ -42,8 +42,8 @@ def validate_project_path(project_path: Path) -> None:
 
 def determine_project_email_addresses(project_path: Path) -> list[tuple[str, str]]:
     """
-    Loads email addresses from the target-project's `.env` file.
-    Note that an os.chdir() is performed to the project path before calling this function.
+    Loads email addresses from the `.env` file in the target-project's parent directory.
+    Reads `project_path.parent / '.env'` directly, so the result does not depend on the current working directory.
     Returns a list of email addresses.
     Assumes the setting `ADMINS_JSON` structured like:
     ADMINS_JSON='
@@ -59,7 +59,8 @@ def determine_project_email_addresses(project_path: Path) -> list[tuple[str, str
     log.info('::: determining email addresses ----------')
     log.debug(f'project_path: ``{project_path}``')
     try:
-        settings: dict = dotenv.dotenv_values('../.env')
+        env_path: Path = project_path.parent / '.env'
+        settings: dict = dotenv.dotenv_values(env_path)
         email_addresses_json: str = settings['ADMINS_JSON']
         email_addresses_list: list[list[str]] = json.loads(email_addresses_json)
         email_addresses: list[tuple[str, str]] = [tuple(pair) for pair in email_addresses_list]  # type: ignore
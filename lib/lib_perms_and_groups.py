@@ -2,6 +2,7 @@
 Checks for correct group and permissions on files in two directories.
 """
 
+import functools
 import grp
 import logging
 import pathlib
@@ -11,13 +12,23 @@ import stat
 log = logging.getLogger(__name__)
 
 
+@functools.cache
+def group_name_for_gid(gid: int) -> str:
+    """
+    Helper function; returns the group-name for the given gid.
+    Memoized, since every item in a .venv usually shares one gid, and each uncached lookup goes through NSS.
+    Called by check_group().
+    """
+    return grp.getgrgid(gid).gr_name
+
+
 def check_group(item: pathlib.Path, expected_group: str) -> str | None:
     """
     Helper function; checks if the group of the given item is the expected group.
     Called by check_files().
     """
     try:
-        item_group: str = grp.getgrgid(item.stat().st_gid).gr_name
+        item_group: str = group_name_for_gid(item.stat().st_gid)
     except Exception as err:
         return f'Cannot determine group: {err}'
 
@@ -5,6 +5,7 @@ Contains code for comparing the newly-compiled `requirements.txt` with the most
 
 import datetime
 import difflib
+import filecmp
 import logging
 import pprint
 import shutil
@@ -14,6 +15,13 @@ from typing import TypedDict
 
 log = logging.getLogger(__name__)
 
+## environment-type -> `uv sync --group` value; used by UvUpdater.make_sync_command()
+SYNC_GROUPS: dict[str, str] = {
+    'local': 'local',
+    'staging': 'staging',
+    'production': 'production',
+}
+
 
 class CompareResult(TypedDict):
     """
@@ -100,13 +108,8 @@ class UvUpdater:
           against _this_ project's `uv.lock`, and update _this_ project's .venv directory.
         Called by self.manage_sync().
         """
-        if environment_type == 'local':
-            group = 'local'
-        elif environment_type == 'staging':
-            group = 'staging'
-        elif environment_type == 'production':
-            group = 'production'
-        else:
+        group: str | None = SYNC_GROUPS.get(environment_type)
+        if group is None:
             msg = f'Invalid environment_type: {environment_type}'
             log.exception(msg)
             raise Exception(msg)
@@ -168,9 +171,15 @@ class UvUpdater:
         Returns a dictionary with keys:
         - "changes": bool — True if files differ; False otherwise (or on error)
         - "diff": str — unified diff text if differences exist; empty string otherwise
+
+        Skips the line-diff entirely when the two files are byte-identical (the usual, no-update, case).
         """
         log.info('::: comparing uv.lock files ----------')
         try:
+            ## short-circuit on identical files --------------------
+            if filecmp.cmp(uv_lock_path, uv_lock_backup_path, shallow=False):  # size check, then block-by-block compare
+                log.info('ok / no differences found between uv.lock and its backup')
+                return CompareResult(changes=False, diff='')
             with uv_lock_path.open() as curr, uv_lock_backup_path.open() as prev:
                 ## read lines ---------------------------------------
                 curr_lines = [line.rstrip() for line in curr.readlines()]
@@ -181,14 +190,13 @@ class UvUpdater:
                         prev_lines, curr_lines, fromfile=str(uv_lock_backup_path), tofile=str(uv_lock_path), lineterm=''
                     )
                 )
-                log.debug(f'diff: \n{pprint.pformat(diff)}')
                 ## log the diff if there are differences ------------
                 if diff:
                     log.info('ok / differences found between uv.lock and its backup')
                 else:
                     log.info('ok / no differences found between uv.lock and its backup')
             diff_text: str = '\n'.join(diff) + '\n'
-            log.debug(f'diff_text: \n{diff_text}')
+            log.debug('diff_text: \n%s', diff_text)  # lazy; skips copying the whole diff when DEBUG is off
             changes: bool = bool(diff)
             return CompareResult(changes=changes, diff=diff_text)
         except Exception as e:
@@ -7,12 +7,15 @@ Usage examples:
     (file) uv run ./run_tests.py -v tests.test_environment_checks
     (class) uv run ./run_tests.py -v tests.test_environment_checks.TestEnvironmentChecks
     (method) uv run ./run_tests.py -v tests.test_environment_checks.TestEnvironmentChecks.test_check_branch_non_main_raises
+    (parallel) uv run ./run_tests.py --parallel
 """
 
 import argparse
+import io
 import os
 import sys
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from dotenv import find_dotenv, load_dotenv
@@ -34,6 +37,43 @@ else:
     load_dotenv(find_dotenv(str(dotenv_path), raise_error_if_not_found=True), override=True)
 
 
+def run_target_in_worker(target: str, verbosity: int) -> tuple[bool, int, str]:
+    """
+    Runs one dotted test target (typically a whole test module) and returns (success, tests_run, output).
+    Executes inside a worker process, so the runner's output is captured rather than streamed.
+    Called by run_targets_in_parallel().
+    """
+    stream = io.StringIO()
+    suite: unittest.TestSuite = unittest.TestLoader().loadTestsFromName(target)
+    runner = unittest.TextTestRunner(stream=stream, verbosity=verbosity)
+    result: unittest.result.TestResult = runner.run(suite)
+    return (result.wasSuccessful(), result.testsRun, stream.getvalue())
+
+
+def run_targets_in_parallel(targets: list[str], verbosity: int) -> bool:
+    """
+    Runs each test target in its own worker process and prints each target's output in order.
+    - Test modules are independent (temp-dirs, mocks), and their wall-clock is mostly subprocess and filesystem waits,
+      so running them side-by-side overlaps that waiting.
+    - Only the unittest runner output is captured; the test modules' logging still goes straight to stderr, so those
+      lines interleave across workers and appear before the ordered output.
+    Called by main().
+    """
+    max_workers: int = max(1, min(len(targets), os.cpu_count() or 1))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results: list[tuple[bool, int, str]] = list(executor.map(run_target_in_worker, targets, [verbosity] * len(targets)))
+    all_ok: bool = True
+    total_run: int = 0
+    for target, (ok, tests_run, output) in zip(targets, results):
+        print(f'== {target} ==', file=sys.stderr)
+        print(output, file=sys.stderr)
+        all_ok = all_ok and ok
+        total_run += tests_run
+    status: str = 'OK' if all_ok else 'FAILED'
+    print(f'Ran {total_run} tests across {len(targets)} worker target(s): {status}', file=sys.stderr)
+    return all_ok
+
+
 def main() -> None:
     """
     Discover and run unittests for this repository.
@@ -49,6 +89,14 @@ def main() -> None:
         action='store_true',
         help='Increase verbosity (equivalent to unittest verbosity=2)',
     )
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help=(
+            'Run each test module (or each given target) in its own worker process; '
+            'runner output prints per target, in order, but test logging is not captured and interleaves ahead of it'
+        ),
+    )
     parser.add_argument(
         'targets',
         nargs='*',
@@ -67,6 +115,11 @@ def main() -> None:
     ## Change working directory to repo root so relative discovery works
     os.chdir(repo_root)
     start_dir = 'tests'
+    verbosity = 2 if args.verbose else 1
+    if args.parallel:
+        ## Run modules (or explicit targets) in worker processes ----
+        targets: list[str] = args.targets or [f'{start_dir}.{p.stem}' for p in sorted(Path(start_dir).glob('test*.py'))]
+        sys.exit(0 if run_targets_in_parallel(targets, verbosity) else 1)
     loader = unittest.TestLoader()
     if args.targets:
         ## Load explicit targets provided on the command line -------
@@ -81,7 +134,6 @@ def main() -> None:
             ## Avoid specifying top_level_dir to prevent importability check on start_dir
         )
     ## Run tests ------------------------------------------------------
-    verbosity = 2 if args.verbose else 1
     runner = unittest.TextTestRunner(verbosity=verbosity)
     result: unittest.result.TestResult = runner.run(suite)
     sys.exit(0 if result.wasSuccessful() else 1)
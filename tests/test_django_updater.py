@@ -1,15 +1,12 @@
-import unittest
 import textwrap
+import unittest
+from unittest.mock import patch
 
 from lib.lib_django_updater import check_for_django_update
 
-
-class TestDjangoUpdater(unittest.TestCase):
-    def test_version_bump_in_uv_lock_diff_returns_true(self) -> None:
-        """
-        Checks that a version bump within Django's [[package]] block returns True.
-        """
-        diff_text = textwrap.dedent("""\
+## uv.lock diff fixtures; dedented once, at import ------------------
+DIFFS: dict[str, str] = {
+    'version_bump': textwrap.dedent("""\
         --- a/uv.lock
         +++ b/uv.lock
          [[package]]
@@ -17,15 +14,9 @@ class TestDjangoUpdater(unittest.TestCase):
         -version = "4.2.20"
         +version = "4.2.27"
          requires-python = ">="3.9
-        
-""")
-        self.assertTrue(check_for_django_update(diff_text))
 
-    def test_wheels_only_changes_return_false(self) -> None:
-        """
-        Checks that changes to files/hashes only (no version change) return False.
-        """
-        diff_text = textwrap.dedent("""\
+        """),
+    'wheels_only': textwrap.dedent("""\
         --- a/uv.lock
         +++ b/uv.lock
          [[package]]
@@ -37,39 +28,88 @@ class TestDjangoUpdater(unittest.TestCase):
         +files = [
         +  {file = "django-4.2.27-py3-none-any.whl", hash = "sha256:NEW"},
         +]
-        
-""")
-        self.assertFalse(check_for_django_update(diff_text))
 
-    def test_same_version_lines_return_false(self) -> None:
-        """
-        Checks that if both -version and +version are the same, returns False.
-        """
-        diff_text = textwrap.dedent("""\
+        """),
+    'same_version': textwrap.dedent("""\
         --- a/uv.lock
         +++ b/uv.lock
          [[package]]
          name = "django"
         -version = "4.2.27"
         +version = "4.2.27"
-        
-""")
-        self.assertFalse(check_for_django_update(diff_text))
 
-    def test_case_insensitive_name_matching_returns_true(self) -> None:
-        """
-        Checks that name = "Django" (capitalized) still matches and detects a bump.
-        """
-        diff_text = textwrap.dedent("""\
+        """),
+    'capitalized_name': textwrap.dedent("""\
         --- a/uv.lock
         +++ b/uv.lock
          [[package]]
          name = "Django"
         -version = "4.2.20"
         +version = "4.2.27"
-        
-""")
-        self.assertTrue(check_for_django_update(diff_text))
+
+        """),
+    'other_package_bump': textwrap.dedent("""\
+        --- a/uv.lock
+        +++ b/uv.lock
+         [[package]]
+         name = "asgiref"
+        -version = "3.8.0"
+        +version = "3.8.1"
+         [[package]]
+         name = "django"
+         version = "4.2.27"
+
+        """),
+    'django_bump_after_other_package': textwrap.dedent("""\
+        --- a/uv.lock
+        +++ b/uv.lock
+         [[package]]
+         name = "asgiref"
+         version = "3.8.1"
+         [[package]]
+         name = "django"
+        -version = "4.2.20"
+        +version = "4.2.27"
+
+        """),
+    'no_django': textwrap.dedent("""\
+        --- a/uv.lock
+        +++ b/uv.lock
+         [[package]]
+         name = "asgiref"
+        -version = "3.8.0"
+        +version = "3.8.1"
+
+        """),
+}
+DIFFS['version_bump_crlf'] = DIFFS['version_bump'].replace('\n', '\r\n')
+
+
+class TestDjangoUpdater(unittest.TestCase):
+    def test_update_detection(self) -> None:
+        """
+        Checks django-update detection across the diff fixtures.
+        """
+        cases: list[tuple[str, bool]] = [
+            ('version_bump', True),  # version bump within django's [[package]] block
+            ('wheels_only', False),  # files/hashes change only; no version change
+            ('same_version', False),  # -version and +version are identical
+            ('capitalized_name', True),  # name = "Django" still matches
+            ('other_package_bump', False),  # bump is in a non-django [[package]] block
+            ('django_bump_after_other_package', True),  # django block follows another package's block
+            ('version_bump_crlf', True),  # windows line-endings
+        ]
+        for diff_name, expected in cases:
+            with self.subTest(diff_name=diff_name, expected=expected):
+                self.assertIs(check_for_django_update(DIFFS[diff_name]), expected)
+
+    def test_no_django_mention_skips_parsing(self) -> None:
+        """
+        Checks that a diff without any django mention returns False without running the line parser.
+        """
+        with patch('lib.lib_django_updater.parse_uv_lock_version_change') as mock_parse:
+            self.assertFalse(check_for_django_update(DIFFS['no_django']))
+            mock_parse.assert_not_called()
 
 
 if __name__ == '__main__':
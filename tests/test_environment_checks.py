@@ -2,18 +2,32 @@
 Tests for environment checks in `lib_environment_checker`.
 """
 
+import functools
 import grp
 import logging
 import os
 import shutil
-import stat
 import subprocess
+import sys
+import tempfile
 import unittest
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
 from lib import lib_environment_checker
+from lib.lib_emailer import Emailer
+from lib.lib_environment_checker import (
+    check_branch,
+    check_git_status,
+    check_group_and_permissions,
+    determine_environment_type,
+    determine_group,
+    determine_project_email_addresses,
+    validate_project_path,
+    validate_pyproject_toml,
+    validate_uv_path,
+)
+from lib.lib_perms_and_groups import group_name_for_gid
 
 ## set up logging ---------------------------------------------------
 logging.basicConfig(
@@ -23,33 +37,276 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
+## fixture paths are created group-writable (see TestEnvironmentChecks.setUp()); this mode is for the deliberate exception
+NOT_GROUP_WRITABLE_FILE: int = 0o644
+
+## git executable, looked up on PATH once; None when git is not installed (the real-git tests are then skipped)
+_GIT: str | None = shutil.which('git')
+
+## shell script that turns a directory holding README.md into a one-commit git repo; identity comes from _GIT_IDENTITY_ENV
+## (`$GIT_BIN` is the absolute path in _GIT, so the shell runs git without a PATH search)
+_GIT_SEED_SCRIPT: str = (
+    '"$GIT_BIN" -c init.defaultBranch=main init --quiet --template='  # empty --template skips copying hooks & info/ samples
+    ' && "$GIT_BIN" add README.md'
+    ' && "$GIT_BIN" -c commit.gpgsign=false -c core.hooksPath=/dev/null commit --quiet --no-verify -m init'
+)
+
+## commit identity for the seed repo, passed via environment so no `git config` calls are needed
+_GIT_IDENTITY_ENV: dict[str, str] = {
+    'GIT_AUTHOR_NAME': 'Test User',
+    'GIT_AUTHOR_EMAIL': 'test@example.com',
+    'GIT_COMMITTER_NAME': 'Test User',
+    'GIT_COMMITTER_EMAIL': 'test@example.com',
+}
+
+## parent-.env and .git/HEAD fixtures
+_ENV_OK: bytes = b'ADMINS_JSON=\'[["Project Admin", "project_admin@example.com"]]\'\n'
+_HEAD_MAIN: bytes = b'ref: refs/heads/main'
+_HEAD_FEATURE: bytes = b'ref: refs/heads/feature/test'
+
+## pyproject.toml fixtures; already stripped and newline-terminated
+_PYPROJECT_VALID: bytes = b"""\
+[project]
+name = "example"
+version = "0.0.0"
+requires-python = ">=3.12"
+
+[dependency-groups]
+staging = ["pkgA>=1.0"]
+prod = ["pkgB>=1.0"]
+"""
+_PYPROJECT_REQUIRES_PYTHON_TEMPLATE: bytes = b"""\
+[project]
+name = "example"
+version = "0.0.0"
+requires-python = "%b"
+
+[dependency-groups]
+staging = ["pkgA>=1.0"]
+prod = ["pkgB>=1.0"]
+"""  # filled with a requires-python spec via `%`
+_PYPROJECT_NO_PROJECT_SECTION: bytes = b"""\
+[dependency-groups]
+staging = ["pkgA>=1.0"]
+prod = ["pkgB>=1.0"]
+"""
+_PYPROJECT_NO_REQUIRES_PYTHON: bytes = b"""\
+[project]
+name = "example"
+version = "0.0.0"
+
+[dependency-groups]
+staging = ["pkgA>=1.0"]
+prod = ["pkgB>=1.0"]
+"""
+_PYPROJECT_EMPTY_REQUIRES_PYTHON: bytes = b"""\
+[project]
+name = "example"
+version = "0.0.0"
+requires-python = ""
+
+[dependency-groups]
+staging = ["pkgA>=1.0"]
+prod = ["pkgB>=1.0"]
+"""
+_PYPROJECT_NUMERIC_REQUIRES_PYTHON: bytes = b"""\
+[project]
+name = "example"
+version = "0.0.0"
+requires-python = 3.12
+
+[dependency-groups]
+staging = ["pkgA>=1.0"]
+prod = ["pkgB>=1.0"]
+"""
+_PYPROJECT_NO_DEPGROUPS: bytes = b"""\
+[project]
+name = "example"
+version = "0.0.0"
+requires-python = ">=3.12"
+"""
+_PYPROJECT_STRING_DEPGROUPS: bytes = b"""\
+[project]
+name = "example"
+version = "0.0.0"
+requires-python = ">=3.12"
+
+dependency-groups = "oops"
+"""
+_PYPROJECT_MISSING_PROD: bytes = b"""\
+[project]
+name = "example"
+version = "0.0.0"
+requires-python = ">=3.12"
+
+[dependency-groups]
+staging = ["pkgA>=1.0"]
+"""
+_PYPROJECT_MISSING_STAGING: bytes = b"""\
+[project]
+name = "example"
+version = "0.0.0"
+requires-python = ">=3.12"
+
+[dependency-groups]
+prod = ["pkgB>=1.0"]
+"""
+
+## the read-only pyproject.toml variants; setUpClass() writes each to its own directory once, for every test to reuse
+_PYPROJECT_VARIANTS: dict[str, bytes] = {
+    'valid': _PYPROJECT_VALID,
+    'no_project_section': _PYPROJECT_NO_PROJECT_SECTION,
+    'no_requires_python': _PYPROJECT_NO_REQUIRES_PYTHON,
+    'empty_requires_python': _PYPROJECT_EMPTY_REQUIRES_PYTHON,
+    'numeric_requires_python': _PYPROJECT_NUMERIC_REQUIRES_PYTHON,
+    'no_depgroups': _PYPROJECT_NO_DEPGROUPS,
+    'string_depgroups': _PYPROJECT_STRING_DEPGROUPS,
+    'missing_prod': _PYPROJECT_MISSING_PROD,
+    'missing_staging': _PYPROJECT_MISSING_STAGING,
+}
+
+
+## RAM-backed temp root, when available; see setUpModule()
+_SHM_DIR: str = '/dev/shm'
+_original_tempdir: str | None = None
+
+
+def setUpModule() -> None:
+    """
+    Points `tempfile` at tmpfs (on Linux, when /dev/shm is writable), so fixture writes and cleanup never touch disk.
+    """
+    global _original_tempdir
+    _original_tempdir = tempfile.tempdir
+    if sys.platform == 'linux' and os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK | os.X_OK):
+        tempfile.tempdir = _SHM_DIR
+
+
+def tearDownModule() -> None:
+    """
+    Restores `tempfile`'s original temp root.
+    """
+    tempfile.tempdir = _original_tempdir
+
 
-class TestEnvironmentChecks(unittest.TestCase):
+@functools.cache
+def _seed_git_repo() -> Path:
+    """
+    Builds a committed one-file git repo on first call, and returns its path on every call; tests copy it.
+    (Spawning git dominates the real-git tests' run time, so the init/add/commit sequence runs once per module run,
+    from a single shell.)
+    The repo is removed, and the cache cleared, by module cleanup.
+    """
+    template_path = Path(tempfile.mkdtemp())
+    unittest.addModuleCleanup(shutil.rmtree, template_path, ignore_errors=True)
+    unittest.addModuleCleanup(_seed_git_repo.cache_clear)
+    (template_path / 'README.md').write_bytes(b'# Test Repo\n')
+    ## keep the user's global and system git config (hooks, signing, etc.) out of the seed repo
+    seed_env: dict[str, str] = {
+        **os.environ,
+        'GIT_BIN': str(_GIT),
+        **_GIT_IDENTITY_ENV,
+        'GIT_CONFIG_GLOBAL': '/dev/null',
+        'GIT_CONFIG_SYSTEM': '/dev/null',
+    }
+    ## stdout is discarded; stderr is inherited, so a failed seed still shows git's error in the test output
+    subprocess.run(
+        ['/bin/sh', '-c', _GIT_SEED_SCRIPT],
+        cwd=template_path,
+        env=seed_env,
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+    return template_path
+
+
+class _SendEmailStub:
+    """
+    Stands in for `Emailer.send_email`; only counts calls, which is all these tests assert on.
+    (An instance attribute on the class is not bound as a method, so it receives just the call's arguments.)
+    """
+
+    def __init__(self) -> None:
+        self.call_count: int = 0
+
+    def __call__(self, *args, **kwargs) -> None:
+        self.call_count += 1
+
+
+class _TempRootTestCase(unittest.TestCase):
+    """
+    Shared fixture for the classes below: one temp root per class, and a call-counting `Emailer.send_email` stub per test.
+    Subclasses set `_temp_prefix` so their temp roots are told apart.
+    """
+
+    _temp_prefix: str = 'envchk-'
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Creates one temp root for the class; each test makes its own sub-directory with `mkdtemp(dir=...)`.
+        """
+        cls._temp_root: str = tempfile.mkdtemp(prefix=cls._temp_prefix)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """
+        Removes the class temp root, and every test's sub-directory with it, in one walk.
+        """
+        shutil.rmtree(cls._temp_root, ignore_errors=True)
+
+    def setUp(self) -> None:
+        """
+        Swaps `Emailer.send_email` for a call-counting stub for every test; tests assert on `self.send_email_stub`.
+        """
+        self.send_email_stub = _SendEmailStub()
+        self.enterContext(patch.object(Emailer, 'send_email', new=self.send_email_stub))
+
+
+class TestEnvironmentChecks(_TempRootTestCase):
     """
     Checks the environmental-validation helpers.
     """
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Writes each pyproject.toml variant once, under the class temp root; validate_pyproject_toml() only reads them,
+        so the tests share these directories via `cls._pyproject_paths`.
+        """
+        super().setUpClass()
+        cls._pyproject_paths: dict[str, Path] = {}
+        for variant_name, pyproject_content in _PYPROJECT_VARIANTS.items():
+            variant_path = Path(cls._temp_root) / f'pyproject-{variant_name}'
+            variant_path.mkdir()
+            (variant_path / 'pyproject.toml').write_bytes(pyproject_content)
+            cls._pyproject_paths[variant_name] = variant_path
+
+    def setUp(self) -> None:
+        """
+        Sets a group-writable umask for the test's duration, on top of the shared email stub.
+        """
+        super().setUp()
+        ## create fixture files/dirs group-writable, as check_group_and_permissions() requires
+        self.addCleanup(os.umask, os.umask(0o002))
+
     ## project path checks ------------------------------------------
 
     def test_validate_project_path_ok(self) -> None:
         """
         Checks legit path.
         """
-        with TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            try:
-                self.assertIsNone(lib_environment_checker.validate_project_path(project_path))
-            except Exception as exc:
-                self.fail(f'Unexpected exception raised: {exc!r}')
+        project_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        try:
+            self.assertIsNone(validate_project_path(project_path))
+        except Exception as exc:
+            self.fail(f'Unexpected exception raised: {exc!r}')
 
     def test_validate_project_path_missing_raises(self):
-        with TemporaryDirectory() as temp_dir:
-            missing_path = Path(temp_dir) / 'missing'
-            with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                with self.assertRaises(Exception) as ctx:
-                    lib_environment_checker.validate_project_path(missing_path)
-            self.assertIn('Error: The provided project_path', str(ctx.exception))
-            mock_send.assert_called_once()  # verifies that the email attempt was made
+        missing_path = Path(tempfile.mkdtemp(dir=self._temp_root)) / 'missing'
+        with self.assertRaises(Exception) as ctx:
+            validate_project_path(missing_path)
+        self.assertIn('Error: The provided project_path', str(ctx.exception))
+        self.assertEqual(1, self.send_email_stub.call_count)  # verifies that the email attempt was made
 
     ## email address checks -----------------------------------------
 
@@ -57,44 +314,29 @@ class TestEnvironmentChecks(unittest.TestCase):
         """
         Checks ADMINS_JSON from parent .env and returned list of (name, email) tuples.
         """
-        original_cwd = os.getcwd()
-        try:
-            with TemporaryDirectory() as parent_dir:
-                parent_path = Path(parent_dir)
-                log.debug(f'parent_path: ``{parent_path}``')
-                project_path = parent_path / 'proj'
-                project_path.mkdir(parents=True, exist_ok=True)
-                ## create parent .env -----------
-                env_content = 'ADMINS_JSON=\'[["Project Admin", "project_admin@example.com"]]\'\n'
-                (parent_path / '.env').write_text(env_content, encoding='utf-8')
-                ## chdir into project directory to mirror production behavior
-                os.chdir(project_path)
-                ## call function ----------------
-                result = lib_environment_checker.determine_project_email_addresses(project_path)
-                ## assert -----------------------
-                self.assertEqual(result, [('Project Admin', 'project_admin@example.com')])
-        finally:
-            os.chdir(original_cwd)
+        parent_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        log.debug(f'parent_path: ``{parent_path}``')
+        project_path = parent_path / 'proj'
+        project_path.mkdir(parents=True, exist_ok=True)
+        ## create parent .env -----------
+        (parent_path / '.env').write_bytes(_ENV_OK)
+        ## call function ----------------
+        result = determine_project_email_addresses(project_path)
+        ## assert -----------------------
+        self.assertEqual(result, [('Project Admin', 'project_admin@example.com')])
 
     def test_determine_project_email_addresses_missing_env_raises(self) -> None:
         """
         Checks problem handling.
         """
-        original_cwd = os.getcwd()
-        try:
-            with TemporaryDirectory() as parent_dir:
-                parent_path = Path(parent_dir)
-                project_path = parent_path / 'proj'
-                project_path.mkdir(parents=True, exist_ok=True)
-                ## intentionally do NOT create parent .env
-                os.chdir(project_path)
-                ## call function ----------------
-                with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                    with self.assertRaises(Exception):
-                        lib_environment_checker.determine_project_email_addresses(project_path)
-                    mock_send.assert_called_once()
-        finally:
-            os.chdir(original_cwd)
+        parent_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        project_path = parent_path / 'proj'
+        project_path.mkdir(parents=True, exist_ok=True)
+        ## intentionally do NOT create parent .env
+        ## call function ----------------
+        with self.assertRaises(Exception):
+            determine_project_email_addresses(project_path)
+        self.assertEqual(1, self.send_email_stub.call_count)
 
     ## branch checks ------------------------------------------------
 
@@ -102,94 +344,79 @@ class TestEnvironmentChecks(unittest.TestCase):
         """
         Checks main branch -- passes without email or exception.
         """
-        with TemporaryDirectory() as temp_dir:
-            ## setup dummy git directory --------
-            project_path = Path(temp_dir)
-            git_dir = project_path / '.git'
-            git_dir.mkdir(parents=True, exist_ok=True)
-            ## create HEAD file -----------------
-            head_path = git_dir / 'HEAD'
-            head_path.write_text('ref: refs/heads/main', encoding='utf-8')
-            ## call function ----------------
-            project_email_addresses = [('Admin', 'admin@example.com')]
-            try:
-                with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                    self.assertIsNone(lib_environment_checker.check_branch(project_path, project_email_addresses))
-                    mock_send.assert_not_called()
-            except Exception as exc:
-                self.fail(f'Unexpected exception raised: {exc!r}')
+        ## setup dummy git directory --------
+        project_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        git_dir = project_path / '.git'
+        git_dir.mkdir(parents=True, exist_ok=True)
+        ## create HEAD file -----------------
+        head_path = git_dir / 'HEAD'
+        head_path.write_bytes(_HEAD_MAIN)
+        ## call function ----------------
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        try:
+            self.assertIsNone(check_branch(project_path, project_email_addresses))
+        except Exception as exc:
+            self.fail(f'Unexpected exception raised: {exc!r}')
+        self.assertEqual(0, self.send_email_stub.call_count)
 
     def test_check_branch_non_main_raises(self) -> None:
         """
         Checks non-main branch -- raises and triggers email.
         """
-        with TemporaryDirectory() as temp_dir:
-            ## setup dummy git directory --------
-            project_path = Path(temp_dir)
-            git_dir = project_path / '.git'
-            git_dir.mkdir(parents=True, exist_ok=True)
-            head_path = git_dir / 'HEAD'
-            head_path.write_text('ref: refs/heads/feature/test', encoding='utf-8')
-            ## call function ----------------
-            project_email_addresses = [('Admin', 'admin@example.com')]
-            with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                with self.assertRaises(Exception) as ctx:
-                    lib_environment_checker.check_branch(project_path, project_email_addresses)
-                self.assertIn('Error: Project is on branch', str(ctx.exception))
-                mock_send.assert_called_once()
+        ## setup dummy git directory --------
+        project_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        git_dir = project_path / '.git'
+        git_dir.mkdir(parents=True, exist_ok=True)
+        head_path = git_dir / 'HEAD'
+        head_path.write_bytes(_HEAD_FEATURE)
+        ## call function ----------------
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        with self.assertRaises(Exception) as ctx:
+            check_branch(project_path, project_email_addresses)
+        self.assertIn('Error: Project is on branch', str(ctx.exception))
+        self.assertEqual(1, self.send_email_stub.call_count)
 
     ## git status checks ---------------------------------------------
     """
-    These actually use git, since the function being tested actually uses git.
+    These mock the `git status` call; TestCheckGitStatusWithGit (below) runs the same checks against a real repo.
     """
 
-    @unittest.skipUnless(shutil.which('git'), 'git is required for git-status tests')
     def test_check_git_status_clean_ok(self) -> None:
         """
         Checks clean git status -- passes without email or exception.
         """
-        with TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            ## initialize git repo
-            subprocess.check_call(['git', 'init'], cwd=project_path)
-            subprocess.check_call(['git', 'config', 'user.name', 'Test User'], cwd=project_path)
-            subprocess.check_call(['git', 'config', 'user.email', 'test@example.com'], cwd=project_path)
-            ## create a tracked file and commit
-            (project_path / 'README.md').write_text('# Test Repo\n', encoding='utf-8')
-            subprocess.check_call(['git', 'add', 'README.md'], cwd=project_path)
-            subprocess.check_call(['git', 'commit', '-m', 'init'], cwd=project_path)
-            project_email_addresses = [('Admin', 'admin@example.com')]
-            try:
-                with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                    self.assertIsNone(lib_environment_checker.check_git_status(project_path, project_email_addresses))
-                    mock_send.assert_not_called()
-            except Exception as exc:
-                self.fail(f'Unexpected exception raised: {exc!r}')
-
-    @unittest.skipUnless(shutil.which('git'), 'git is required for git-status tests')
+        project_path = Path('/tmp/unused-project')  # never touched; `git status` is mocked
+        git_result = subprocess.CompletedProcess(
+            args=['git', 'status'],
+            returncode=0,
+            stdout='On branch main\nnothing to commit, working tree clean\n',
+            stderr='',
+        )
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        self.enterContext(patch('lib.lib_git_handler.subprocess.run', return_value=git_result))
+        try:
+            self.assertIsNone(check_git_status(project_path, project_email_addresses))
+        except Exception as exc:
+            self.fail(f'Unexpected exception raised: {exc!r}')
+        self.assertEqual(0, self.send_email_stub.call_count)
+
     def test_check_git_status_dirty_raises(self) -> None:
         """
         Checks dirty git status -- raises and triggers email.
         """
-        with TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            ## initialize git repo
-            subprocess.check_call(['git', 'init'], cwd=project_path)
-            subprocess.check_call(['git', 'config', 'user.name', 'Test User'], cwd=project_path)
-            subprocess.check_call(['git', 'config', 'user.email', 'test@example.com'], cwd=project_path)
-            ## create a tracked file and commit
-            test_file = project_path / 'README.md'
-            test_file.write_text('# Test Repo\n', encoding='utf-8')
-            subprocess.check_call(['git', 'add', 'README.md'], cwd=project_path)
-            subprocess.check_call(['git', 'commit', '-m', 'init'], cwd=project_path)
-            ## make the repo dirty
-            test_file.write_text('# Test Repo\nmodified\n', encoding='utf-8')
-            project_email_addresses = [('Admin', 'admin@example.com')]
-            with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                with self.assertRaises(Exception) as ctx:
-                    lib_environment_checker.check_git_status(project_path, project_email_addresses)
-                self.assertIn('Error: git-status check failed.', str(ctx.exception))
-                mock_send.assert_called_once()
+        project_path = Path('/tmp/unused-project')  # never touched; `git status` is mocked
+        git_result = subprocess.CompletedProcess(
+            args=['git', 'status'],
+            returncode=0,
+            stdout='On branch main\nChanges not staged for commit:\n\tmodified:   README.md\n',
+            stderr='',
+        )
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        self.enterContext(patch('lib.lib_git_handler.subprocess.run', return_value=git_result))
+        with self.assertRaises(Exception) as ctx:
+            check_git_status(project_path, project_email_addresses)
+        self.assertIn('Error: git-status check failed.', str(ctx.exception))
+        self.assertEqual(1, self.send_email_stub.call_count)
 
     ## pyproject.toml validation checks -----------------------------
 
@@ -197,217 +424,108 @@ class TestEnvironmentChecks(unittest.TestCase):
         """
         Checks that validation passes with complete valid pyproject.toml.
         """
-        with TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            pyproject_content = """
-            [project]
-            name = "example"
-            version = "0.0.0"
-            requires-python = ">=3.12"
-
-            [dependency-groups]
-            staging = ["pkgA>=1.0"]
-            prod = ["pkgB>=1.0"]
-            """
-            (project_path / 'pyproject.toml').write_text(pyproject_content.strip() + '\n', encoding='utf-8')
-            project_email_addresses = [('Admin', 'admin@example.com')]
-            try:
-                with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                    self.assertIsNone(
-                        lib_environment_checker.validate_pyproject_toml(project_path, project_email_addresses)
-                    )
-                    mock_send.assert_not_called()
-            except Exception as exc:
-                self.fail(f'Unexpected exception raised: {exc!r}')
+        project_path = self._pyproject_paths['valid']
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        try:
+            self.assertIsNone(validate_pyproject_toml(project_path, project_email_addresses))
+        except Exception as exc:
+            self.fail(f'Unexpected exception raised: {exc!r}')
+        self.assertEqual(0, self.send_email_stub.call_count)
 
     def test_validate_pyproject_toml_missing_file_raises(self) -> None:
         """
         Checks that missing pyproject.toml triggers error and email.
         """
-        with TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            project_email_addresses = [('Admin', 'admin@example.com')]
-            with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                with self.assertRaises(Exception) as ctx:
-                    lib_environment_checker.validate_pyproject_toml(project_path, project_email_addresses)
-                self.assertIn('Error: Missing pyproject.toml', str(ctx.exception))
-                mock_send.assert_called_once()
+        project_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        with self.assertRaises(Exception) as ctx:
+            validate_pyproject_toml(project_path, project_email_addresses)
+        self.assertIn('Error: Missing pyproject.toml', str(ctx.exception))
+        self.assertEqual(1, self.send_email_stub.call_count)
 
     def test_validate_pyproject_toml_missing_project_section_raises(self) -> None:
         """
         Checks that missing [project] section triggers error and email.
         """
-        with TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            pyproject_content = """
-            [dependency-groups]
-            staging = ["pkgA>=1.0"]
-            prod = ["pkgB>=1.0"]
-            """
-            (project_path / 'pyproject.toml').write_text(pyproject_content.strip() + '\n', encoding='utf-8')
-            project_email_addresses = [('Admin', 'admin@example.com')]
-            with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                with self.assertRaises(Exception) as ctx:
-                    lib_environment_checker.validate_pyproject_toml(project_path, project_email_addresses)
-                self.assertIn('`[project]` section missing', str(ctx.exception))
-                mock_send.assert_called_once()
+        project_path = self._pyproject_paths['no_project_section']
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        with self.assertRaises(Exception) as ctx:
+            validate_pyproject_toml(project_path, project_email_addresses)
+        self.assertIn('`[project]` section missing', str(ctx.exception))
+        self.assertEqual(1, self.send_email_stub.call_count)
 
     def test_validate_pyproject_toml_missing_requires_python_raises(self) -> None:
         """
         Checks that missing requires-python field triggers error and email.
         """
-        with TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            pyproject_content = """
-            [project]
-            name = "example"
-            version = "0.0.0"
-
-            [dependency-groups]
-            staging = ["pkgA>=1.0"]
-            prod = ["pkgB>=1.0"]
-            """
-            (project_path / 'pyproject.toml').write_text(pyproject_content.strip() + '\n', encoding='utf-8')
-            project_email_addresses = [('Admin', 'admin@example.com')]
-            with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                with self.assertRaises(Exception) as ctx:
-                    lib_environment_checker.validate_pyproject_toml(project_path, project_email_addresses)
-                self.assertIn('`requires-python` field missing', str(ctx.exception))
-                mock_send.assert_called_once()
+        project_path = self._pyproject_paths['no_requires_python']
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        with self.assertRaises(Exception) as ctx:
+            validate_pyproject_toml(project_path, project_email_addresses)
+        self.assertIn('`requires-python` field missing', str(ctx.exception))
+        self.assertEqual(1, self.send_email_stub.call_count)
 
     def test_validate_pyproject_toml_empty_requires_python_raises(self) -> None:
         """
         Checks that empty requires-python value triggers error and email.
         """
-        with TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            pyproject_content = """
-            [project]
-            name = "example"
-            version = "0.0.0"
-            requires-python = ""
-
-            [dependency-groups]
-            staging = ["pkgA>=1.0"]
-            prod = ["pkgB>=1.0"]
-            """
-            (project_path / 'pyproject.toml').write_text(pyproject_content.strip() + '\n', encoding='utf-8')
-            project_email_addresses = [('Admin', 'admin@example.com')]
-            with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                with self.assertRaises(Exception) as ctx:
-                    lib_environment_checker.validate_pyproject_toml(project_path, project_email_addresses)
-                self.assertIn('`requires-python` field missing', str(ctx.exception))
-                mock_send.assert_called_once()
+        project_path = self._pyproject_paths['empty_requires_python']
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        with self.assertRaises(Exception) as ctx:
+            validate_pyproject_toml(project_path, project_email_addresses)
+        self.assertIn('`requires-python` field missing', str(ctx.exception))
+        self.assertEqual(1, self.send_email_stub.call_count)
 
     def test_validate_pyproject_toml_wrong_type_requires_python_raises(self) -> None:
         """
         Checks that non-string requires-python value triggers error and email.
         """
-        with TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            pyproject_content = """
-            [project]
-            name = "example"
-            version = "0.0.0"
-            requires-python = 3.12
-
-            [dependency-groups]
-            staging = ["pkgA>=1.0"]
-            prod = ["pkgB>=1.0"]
-            """
-            (project_path / 'pyproject.toml').write_text(pyproject_content.strip() + '\n', encoding='utf-8')
-            project_email_addresses = [('Admin', 'admin@example.com')]
-            with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                with self.assertRaises(Exception) as ctx:
-                    lib_environment_checker.validate_pyproject_toml(project_path, project_email_addresses)
-                self.assertIn('`requires-python` field missing', str(ctx.exception))
-                mock_send.assert_called_once()
+        project_path = self._pyproject_paths['numeric_requires_python']
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        with self.assertRaises(Exception) as ctx:
+            validate_pyproject_toml(project_path, project_email_addresses)
+        self.assertIn('`requires-python` field missing', str(ctx.exception))
+        self.assertEqual(1, self.send_email_stub.call_count)
 
     def test_validate_pyproject_toml_missing_dependency_groups_raises(self) -> None:
         """
         Checks that missing [dependency-groups] section triggers error and email.
         """
-        with TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            pyproject_content = """
-            [project]
-            name = "example"
-            version = "0.0.0"
-            requires-python = ">=3.12"
-            """
-            (project_path / 'pyproject.toml').write_text(pyproject_content.strip() + '\n', encoding='utf-8')
-            project_email_addresses = [('Admin', 'admin@example.com')]
-            with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                with self.assertRaises(Exception) as ctx:
-                    lib_environment_checker.validate_pyproject_toml(project_path, project_email_addresses)
-                self.assertIn('`[dependency-groups]` section missing', str(ctx.exception))
-                mock_send.assert_called_once()
+        project_path = self._pyproject_paths['no_depgroups']
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        with self.assertRaises(Exception) as ctx:
+            validate_pyproject_toml(project_path, project_email_addresses)
+        self.assertIn('`[dependency-groups]` section missing', str(ctx.exception))
+        self.assertEqual(1, self.send_email_stub.call_count)
 
     def test_validate_pyproject_toml_wrong_type_dependency_groups_raises(self) -> None:
         """
         Checks that non-dict dependency-groups value triggers error and email.
         """
-        with TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            pyproject_content = """
-            [project]
-            name = "example"
-            version = "0.0.0"
-            requires-python = ">=3.12"
-
-            dependency-groups = "oops"
-            """
-            (project_path / 'pyproject.toml').write_text(pyproject_content.strip() + '\n', encoding='utf-8')
-            project_email_addresses = [('Admin', 'admin@example.com')]
-            with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                with self.assertRaises(Exception) as ctx:
-                    lib_environment_checker.validate_pyproject_toml(project_path, project_email_addresses)
-                self.assertIn('`[dependency-groups]` section missing', str(ctx.exception))
-                mock_send.assert_called_once()
+        project_path = self._pyproject_paths['string_depgroups']
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        with self.assertRaises(Exception) as ctx:
+            validate_pyproject_toml(project_path, project_email_addresses)
+        self.assertIn('`[dependency-groups]` section missing', str(ctx.exception))
+        self.assertEqual(1, self.send_email_stub.call_count)
 
     def test_validate_pyproject_toml_missing_dependency_group_keys_raises(self) -> None:
         """
         Checks that missing required keys in [dependency-groups] triggers error and email.
         """
-        ## case A: missing prod key
-        with TemporaryDirectory() as temp_dir_a:
-            project_path_a = Path(temp_dir_a)
-            pyproject_content_a = """
-            [project]
-            name = "example"
-            version = "0.0.0"
-            requires-python = ">=3.12"
-
-            [dependency-groups]
-            staging = ["pkgA>=1.0"]
-            """
-            (project_path_a / 'pyproject.toml').write_text(pyproject_content_a.strip() + '\n', encoding='utf-8')
-            pea = [('Admin', 'admin@example.com')]
-            with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send_a:
-                with self.assertRaises(Exception) as ctx_a:
-                    lib_environment_checker.validate_pyproject_toml(project_path_a, pea)
-                self.assertIn('missing required key(s): prod', str(ctx_a.exception))
-                mock_send_a.assert_called_once()
-
-        ## case B: missing staging key
-        with TemporaryDirectory() as temp_dir_b:
-            project_path_b = Path(temp_dir_b)
-            pyproject_content_b = """
-            [project]
-            name = "example"
-            version = "0.0.0"
-            requires-python = ">=3.12"
-
-            [dependency-groups]
-            prod = ["pkgB>=1.0"]
-            """
-            (project_path_b / 'pyproject.toml').write_text(pyproject_content_b.strip() + '\n', encoding='utf-8')
-            peb = [('Admin', 'admin@example.com')]
-            with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send_b:
-                with self.assertRaises(Exception) as ctx_b:
-                    lib_environment_checker.validate_pyproject_toml(project_path_b, peb)
-                self.assertIn('missing required key(s): staging', str(ctx_b.exception))
-                mock_send_b.assert_called_once()
+        cases = [
+            ('missing_prod', 'prod'),
+            ('missing_staging', 'staging'),
+        ]
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        for variant_name, missing_key in cases:
+            with self.subTest(variant_name=variant_name, missing_key=missing_key):
+                self.send_email_stub.call_count = 0
+                project_path = self._pyproject_paths[variant_name]
+                with self.assertRaises(Exception) as ctx:
+                    validate_pyproject_toml(project_path, project_email_addresses)
+                self.assertIn(f'missing required key(s): {missing_key}', str(ctx.exception))
+                self.assertEqual(1, self.send_email_stub.call_count)
 
     def test_validate_pyproject_toml_various_formats_ok(self) -> None:
         """
@@ -421,28 +539,15 @@ class TestEnvironmentChecks(unittest.TestCase):
         ]
         for version_spec, description in formats:
             with self.subTest(version_spec=version_spec, description=description):
-                with TemporaryDirectory() as temp_dir:
-                    project_path = Path(temp_dir)
-                    pyproject_content = f"""
-                    [project]
-                    name = "example"
-                    version = "0.0.0"
-                    requires-python = "{version_spec}"
-
-                    [dependency-groups]
-                    staging = ["pkgA>=1.0"]
-                    prod = ["pkgB>=1.0"]
-                    """
-                    (project_path / 'pyproject.toml').write_text(pyproject_content.strip() + '\n', encoding='utf-8')
-                    project_email_addresses = [('Admin', 'admin@example.com')]
-                    try:
-                        with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                            self.assertIsNone(
-                                lib_environment_checker.validate_pyproject_toml(project_path, project_email_addresses)
-                            )
-                            mock_send.assert_not_called()
-                    except Exception as exc:
-                        self.fail(f'Unexpected exception raised for {description}: {exc!r}')
+                project_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+                pyproject_content: bytes = _PYPROJECT_REQUIRES_PYTHON_TEMPLATE % version_spec.encode()
+                (project_path / 'pyproject.toml').write_bytes(pyproject_content)
+                project_email_addresses = [('Admin', 'admin@example.com')]
+                try:
+                    self.assertIsNone(validate_pyproject_toml(project_path, project_email_addresses))
+                except Exception as exc:
+                    self.fail(f'Unexpected exception raised for {description}: {exc!r}')
+                self.assertEqual(0, self.send_email_stub.call_count)
 
     ## environment-type checks ---------------------------------------
 
@@ -450,23 +555,27 @@ class TestEnvironmentChecks(unittest.TestCase):
         """
         Checks environment-type mapping from hostname.
         """
-        with TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            project_email_addresses = [('Admin', 'admin@example.com')]
-
-            cases = [
-                ('dev-ci-01', 'staging'),
-                ('qa-host', 'staging'),
-                ('prod-01', 'production'),
-                ('laptop', 'local'),
-            ]
-            for hostname, expected in cases:
-                with self.subTest(hostname=hostname, expected=expected):
-                    with patch('lib.lib_environment_checker.subprocess.check_output', return_value=hostname + '\n'):
-                        result = lib_environment_checker.determine_environment_type(
-                            project_path, project_email_addresses
-                        )
-                        self.assertEqual(expected, result)
+        project_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        project_email_addresses = [('Admin', 'admin@example.com')]
+
+        cases = [
+            ('dev-ci-01', 'staging'),
+            ('qa-host', 'staging'),
+            ('prod-01', 'production'),
+            ('laptop', 'local'),
+        ]
+        ## one patch for all cases; each `hostname` call returns the next case's output
+        mock_check_output = self.enterContext(
+            patch.object(
+                lib_environment_checker.subprocess, 'check_output', side_effect=[hostname + '\n' for hostname, _ in cases]
+            )
+        )
+        for hostname, expected in cases:
+            with self.subTest(hostname=hostname, expected=expected):
+                result = determine_environment_type(project_path, project_email_addresses)
+                self.assertEqual(expected, result)
+        self.assertEqual(len(cases), mock_check_output.call_count)
+        self.assertEqual(0, self.send_email_stub.call_count)
 
     ## uv-path checks -----------------------------------------------
 
@@ -474,65 +583,62 @@ class TestEnvironmentChecks(unittest.TestCase):
         """
         Checks legit uv path.
         """
-        with TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            uv_path = project_path / 'uv'
-            uv_path.write_text('#!/bin/sh\n', encoding='utf-8')  # create a dummy file
-            try:
-                self.assertIsNone(lib_environment_checker.validate_uv_path(uv_path, project_path))
-            except Exception as exc:
-                self.fail(f'Unexpected exception raised: {exc!r}')
+        project_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        uv_path = project_path / 'uv'
+        uv_path.write_bytes(b'#!/bin/sh\n')  # create a dummy file
+        try:
+            self.assertIsNone(validate_uv_path(uv_path, project_path))
+        except Exception as exc:
+            self.fail(f'Unexpected exception raised: {exc!r}')
 
     def test_validate_uv_path_missing_raises(self) -> None:
         """
         Checks missing uv path triggers email and raises.
         """
-        with TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            missing_uv = project_path / 'nope-uv'
-            with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                with self.assertRaises(Exception) as ctx:
-                    lib_environment_checker.validate_uv_path(missing_uv, project_path)
-                self.assertIn('Error: The provided uv_path', str(ctx.exception))
-                mock_send.assert_called_once()
+        project_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        missing_uv = project_path / 'nope-uv'
+        with self.assertRaises(Exception) as ctx:
+            validate_uv_path(missing_uv, project_path)
+        self.assertIn('Error: The provided uv_path', str(ctx.exception))
+        self.assertEqual(1, self.send_email_stub.call_count)
 
     ## group-determination checks ------------------------------------
 
     def test_determine_group_ok(self) -> None:
         """
-        Checks group inference from a directory with at least one file.
-        """
-        with TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            ## create a file so ls -l returns entries with a group
-            sample_file = project_path / 'example.txt'
-            sample_file.write_text('data', encoding='utf-8')
-
-            ## compute expected group via grp and the file's gid
-            expected_group = grp.getgrgid(os.stat(sample_file).st_gid).gr_name
-
-            project_email_addresses = [('Admin', 'admin@example.com')]
-            try:
-                with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                    result = lib_environment_checker.determine_group(project_path, project_email_addresses)
-                    self.assertEqual(expected_group, result)
-                    mock_send.assert_not_called()
-            except Exception as exc:
-                self.fail(f'Unexpected exception raised: {exc!r}')
+        Checks group inference picks the most common group in the `ls -l` listing.
+        (The listing is faked, so no `ls` process is spawned; the invalid-directory test below still runs the real `ls`.)
+        """
+        project_path = Path('/tmp/unused-project')  # never touched; `ls -l` is mocked
+        fake_listing = (
+            'total 12\n'
+            '-rw-rw-r-- 1 user devs 4 Jan  1 00:00 a.txt\n'
+            '-rw-rw-r-- 1 user devs 4 Jan  1 00:00 b.txt\n'
+            '-rw-r--r-- 1 user other 4 Jan  1 00:00 c.txt\n'
+        )
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        mock_check_output = self.enterContext(
+            patch.object(lib_environment_checker.subprocess, 'check_output', return_value=fake_listing)
+        )
+        try:
+            result = determine_group(project_path, project_email_addresses)
+        except Exception as exc:
+            self.fail(f'Unexpected exception raised: {exc!r}')
+        self.assertEqual('devs', result)
+        mock_check_output.assert_called_once_with(['ls', '-l', str(project_path)], text=True)
+        self.assertEqual(0, self.send_email_stub.call_count)
 
     def test_determine_group_invalid_raises(self) -> None:
         """
         Checks error on empty directory where no group can be inferred.
         """
-        with TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            ## leave directory empty so `ls -l` yields no file entries
-            project_email_addresses = [('Admin', 'admin@example.com')]
-            with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                with self.assertRaises(Exception) as ctx:
-                    lib_environment_checker.determine_group(project_path, project_email_addresses)
-                self.assertIn('Error inferring group:', str(ctx.exception))
-                mock_send.assert_called_once()
+        project_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        ## leave directory empty so `ls -l` yields no file entries
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        with self.assertRaises(Exception) as ctx:
+            determine_group(project_path, project_email_addresses)
+        self.assertIn('Error inferring group:', str(ctx.exception))
+        self.assertEqual(1, self.send_email_stub.call_count)
 
     ## permissions checks -------------------------------------------
 
@@ -540,116 +646,139 @@ class TestEnvironmentChecks(unittest.TestCase):
         """
         Checks that group and permissions validation passes when everything is group-writable and owned by expected group.
         """
-        with TemporaryDirectory() as parent_dir:
-            parent_path = Path(parent_dir)
-            project_path = parent_path / 'proj'
-            project_path.mkdir(parents=True, exist_ok=True)
-
-            ## set up .venv with a file
-            venv_dir = project_path / '.venv'
-            venv_dir.mkdir(parents=True, exist_ok=True)
-            venv_file = venv_dir / 'file.txt'
-            venv_file.write_text('content', encoding='utf-8')
-
-            ## make group-writable on dir and file
-            venv_dir.chmod(venv_dir.stat().st_mode | stat.S_IWGRP)
-            venv_file.chmod(venv_file.stat().st_mode | stat.S_IWGRP)
-
-            ## create uv.lock.bak in parent of project_path and make group-writable
-            uv_bak = parent_path / 'uv.lock.bak'
-            uv_bak.write_text('backup', encoding='utf-8')
-            uv_bak.chmod(uv_bak.stat().st_mode | stat.S_IWGRP)
-
-            ## determine expected_group from one of the files
-            expected_group = grp.getgrgid(os.stat(venv_file).st_gid).gr_name
-
-            project_email_addresses = [('Admin', 'admin@example.com')]
-            try:
-                with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                    self.assertIsNone(
-                        lib_environment_checker.check_group_and_permissions(
-                            project_path, expected_group, project_email_addresses
-                        )
-                    )
-                    mock_send.assert_not_called()
-            except Exception as exc:
-                self.fail(f'Unexpected exception raised: {exc!r}')
+        parent_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        project_path = parent_path / 'proj'
+        project_path.mkdir(parents=True, exist_ok=True)
+
+        ## set up .venv with a file
+        venv_dir = project_path / '.venv'
+        venv_dir.mkdir(parents=True, exist_ok=True)
+        venv_file = venv_dir / 'file.txt'
+        venv_file.write_bytes(b'content')  # group-writable at creation, via setUp()'s umask
+
+        ## create uv.lock.bak in parent of project_path (also group-writable)
+        uv_bak = parent_path / 'uv.lock.bak'
+        uv_bak.write_bytes(b'backup')
+
+        ## determine expected_group from the .venv file
+        expected_group = grp.getgrgid(os.stat(venv_file).st_gid).gr_name
+
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        try:
+            self.assertIsNone(check_group_and_permissions(project_path, expected_group, project_email_addresses))
+        except Exception as exc:
+            self.fail(f'Unexpected exception raised: {exc!r}')
+        self.assertEqual(0, self.send_email_stub.call_count)
 
     def test_check_group_and_permissions_perm_issue_raises(self) -> None:
         """
         Checks that missing group-write on a .venv file triggers an error and email.
         """
-        with TemporaryDirectory() as parent_dir:
-            parent_path = Path(parent_dir)
-            project_path = parent_path / 'proj'
-            project_path.mkdir(parents=True, exist_ok=True)
+        parent_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        project_path = parent_path / 'proj'
+        project_path.mkdir(parents=True, exist_ok=True)
 
-            ## set up .venv with two files
-            venv_dir = project_path / '.venv'
-            venv_dir.mkdir(parents=True, exist_ok=True)
-            good_file = venv_dir / 'good.txt'
-            bad_file = venv_dir / 'bad.txt'
-            good_file.write_text('ok', encoding='utf-8')
-            bad_file.write_text('not-ok', encoding='utf-8')
+        ## set up .venv with two files
+        venv_dir = project_path / '.venv'
+        venv_dir.mkdir(parents=True, exist_ok=True)
+        good_file = venv_dir / 'good.txt'
+        bad_file = venv_dir / 'bad.txt'
+        good_file.write_bytes(b'ok')
+        bad_file.write_bytes(b'not-ok')
 
-            ## make group-writable on dir and good file
-            venv_dir.chmod(venv_dir.stat().st_mode | stat.S_IWGRP)
-            good_file.chmod(good_file.stat().st_mode | stat.S_IWGRP)
+        ## ensure bad_file is NOT group-writable (everything else is, via setUp()'s umask)
+        bad_file.chmod(NOT_GROUP_WRITABLE_FILE)
 
-            ## ensure bad_file is NOT group-writable
-            bad_file.chmod(bad_file.stat().st_mode & ~stat.S_IWGRP)
+        ## create uv.lock.bak in parent
+        uv_bak = parent_path / 'uv.lock.bak'
+        uv_bak.write_bytes(b'backup')
 
-            ## create uv.lock.bak in parent and make group-writable
-            uv_bak = parent_path / 'uv.lock.bak'
-            uv_bak.write_text('backup', encoding='utf-8')
-            uv_bak.chmod(uv_bak.stat().st_mode | stat.S_IWGRP)
+        ## expected group from a file
+        expected_group = grp.getgrgid(os.stat(good_file).st_gid).gr_name
 
-            ## expected group from a file
-            expected_group = grp.getgrgid(os.stat(good_file).st_gid).gr_name
-
-            project_email_addresses = [('Admin', 'admin@example.com')]
-            with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                with self.assertRaises(Exception) as ctx:
-                    lib_environment_checker.check_group_and_permissions(
-                        project_path, expected_group, project_email_addresses
-                    )
-                self.assertIn('Error: Group/Permissions check failed.', str(ctx.exception))
-                mock_send.assert_called_once()
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        with self.assertRaises(Exception) as ctx:
+            check_group_and_permissions(project_path, expected_group, project_email_addresses)
+        self.assertIn('Error: Group/Permissions check failed.', str(ctx.exception))
+        self.assertEqual(1, self.send_email_stub.call_count)
 
     def test_check_group_and_permissions_wrong_group_raises(self) -> None:
         """
         Checks that mismatched group ownership triggers an error and email.
         """
-        with TemporaryDirectory() as parent_dir:
-            parent_path = Path(parent_dir)
-            project_path = parent_path / 'proj'
-            project_path.mkdir(parents=True, exist_ok=True)
+        parent_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        project_path = parent_path / 'proj'
+        project_path.mkdir(parents=True, exist_ok=True)
 
-            ## set up .venv with a file
-            venv_dir = project_path / '.venv'
-            venv_dir.mkdir(parents=True, exist_ok=True)
-            vfile = venv_dir / 'file.txt'
-            vfile.write_text('content', encoding='utf-8')
+        ## set up .venv with a file
+        venv_dir = project_path / '.venv'
+        venv_dir.mkdir(parents=True, exist_ok=True)
+        vfile = venv_dir / 'file.txt'
+        vfile.write_bytes(b'content')  # group-writable via setUp()'s umask, so only group mismatch causes failure
 
-            ## ensure group-writable so only group mismatch causes failure
-            venv_dir.chmod(venv_dir.stat().st_mode | stat.S_IWGRP)
-            vfile.chmod(vfile.stat().st_mode | stat.S_IWGRP)
+        ## create uv.lock.bak in parent
+        uv_bak = parent_path / 'uv.lock.bak'
+        uv_bak.write_bytes(b'backup')
 
-            ## create uv.lock.bak in parent and make group-writable
-            uv_bak = parent_path / 'uv.lock.bak'
-            uv_bak.write_text('backup', encoding='utf-8')
-            uv_bak.chmod(uv_bak.stat().st_mode | stat.S_IWGRP)
+        ## pick a wrong expected group (different from actual)
+        actual_group = grp.getgrgid(os.stat(vfile).st_gid).gr_name
+        wrong_group = actual_group + '_not'
 
-            ## pick a wrong expected group (different from actual)
-            actual_group = grp.getgrgid(os.stat(vfile).st_gid).gr_name
-            wrong_group = actual_group + '_not'
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        with self.assertRaises(Exception) as ctx:
+            check_group_and_permissions(project_path, wrong_group, project_email_addresses)
+        self.assertIn('Error: Group/Permissions check failed.', str(ctx.exception))
+        self.assertEqual(1, self.send_email_stub.call_count)
 
-            project_email_addresses = [('Admin', 'admin@example.com')]
-            with patch('lib.lib_environment_checker.Emailer.send_email', return_value=None) as mock_send:
-                with self.assertRaises(Exception) as ctx:
-                    lib_environment_checker.check_group_and_permissions(project_path, wrong_group, project_email_addresses)
-                self.assertIn('Error: Group/Permissions check failed.', str(ctx.exception))
-                mock_send.assert_called_once()
+    def test_group_name_for_gid_matches_grp_and_is_memoized(self) -> None:
+        """
+        Checks that `group_name_for_gid()` returns grp's name for a gid, and answers repeat lookups from its cache.
+        """
+        gid = os.getgid()
+        group_name_for_gid.cache_clear()
+        self.assertEqual(grp.getgrgid(gid).gr_name, group_name_for_gid(gid))
+        self.assertEqual(grp.getgrgid(gid).gr_name, group_name_for_gid(gid))
+        self.assertEqual(1, group_name_for_gid.cache_info().hits)
+
+
+@unittest.skipUnless(_GIT, 'git is required for git-status tests')
+class TestCheckGitStatusWithGit(_TempRootTestCase):
+    """
+    Checks `check_git_status()` against real git repos.
+    Each test works on a copy of the template repo from _seed_git_repo().
+    """
+
+    _temp_prefix = 'envchk-git-'
+
+    def test_clean_ok(self) -> None:
+        """
+        Checks clean git status -- passes without email or exception.
+        """
+        project_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        ## copy the committed template repo
+        shutil.copytree(_seed_git_repo(), project_path, dirs_exist_ok=True)
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        try:
+            self.assertIsNone(check_git_status(project_path, project_email_addresses))
+        except Exception as exc:
+            self.fail(f'Unexpected exception raised: {exc!r}')
+        self.assertEqual(0, self.send_email_stub.call_count)
+
+    def test_dirty_raises(self) -> None:
+        """
+        Checks dirty git status -- raises and triggers email.
+        """
+        project_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        ## copy the committed template repo
+        shutil.copytree(_seed_git_repo(), project_path, dirs_exist_ok=True)
+        test_file = project_path / 'README.md'
+        ## make the repo dirty
+        test_file.write_bytes(b'# Test Repo\nmodified\n')
+        project_email_addresses = [('Admin', 'admin@example.com')]
+        with self.assertRaises(Exception) as ctx:
+            check_git_status(project_path, project_email_addresses)
+        self.assertIn('Error: git-status check failed.', str(ctx.exception))
+        self.assertEqual(1, self.send_email_stub.call_count)
 
 
 if __name__ == '__main__':
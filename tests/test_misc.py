@@ -3,6 +3,7 @@ Miscellaneous tests for git operations and other utilities.
 """
 
 import logging
+import os
 import subprocess
 import sys
 import unittest
@@ -13,7 +14,7 @@ from unittest.mock import patch
 this_file_path = Path(__file__).resolve()
 stuff_dir = this_file_path.parent.parent
 sys.path.append(str(stuff_dir))
-from lib.lib_git_handler import GitHandler  # noqa: E402  (suppresses linter warning)
+from lib.lib_git_handler import GitHandler, run_git_status  # noqa: E402  (suppresses linter warning)
 
 ## set up logging ---------------------------------------------------
 logging.basicConfig(
@@ -25,18 +26,20 @@ log = logging.getLogger(__name__)
 
 
 class TestGitCommands(unittest.TestCase):
-    def setUp(self):
-        self.git_handler = GitHandler()
-
-    def tearDown(self):
-        pass
+    @classmethod
+    def setUpClass(cls):
+        """
+        Creates one GitHandler shared by all tests in the class.
+        (`subprocess.run` is mocked per-test, so no git process is spawned.)
+        """
+        cls.git_handler = GitHandler()
 
     def test_git_pull__A(self):
         """
         ::: Checks that `Already up to date.` is detected properly.
         Assumes current-project is, actually, already up-to-date.
         """
-        cur_dir = Path('./').resolve()
+        cur_dir = Path(os.path.abspath('.'))  # no symlink resolution needed, so skips realpath's per-component lstat
         log.debug(f'cur_dir: {cur_dir}')
         ## Mock subprocess.run to avoid relying on CI/local git state
         with patch('subprocess.run') as mock_run:
@@ -48,9 +51,23 @@ class TestGitCommands(unittest.TestCase):
             )
             git_result: tuple[bool, dict] = self.git_handler.run_git_pull(cur_dir)
             (ok, output) = git_result
-            self.assertTrue(ok is True)
+            self.assertIs(ok, True)
         # self.assertIn('Already up to date.', output['stdout'])
 
+    def test_git_status_runs_plain_status(self):
+        """
+        Checks that `run_git_status()` runs a plain `git status`, with no flags that older git versions would reject.
+        """
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess(
+                args=['git', 'status'],
+                returncode=0,
+                stdout='On branch main\nnothing to commit, working tree clean\n',
+                stderr='',
+            )
+            run_git_status(Path(os.path.abspath('.')))
+            self.assertEqual(['git', 'status'], mock_run.call_args.args[0])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,8 +1,10 @@
 import logging
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
 
+from lib.lib_django_updater import check_for_django_update
 from lib.lib_uv_updater import UvUpdater
 
 ## set up logging ---------------------------------------------------
@@ -15,56 +17,126 @@ log = logging.getLogger(__name__)
 
 
 class TestUvUpdater(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Makes the directory the tests put their lock files under, and a stateless UvUpdater they all use.
+        """
+        cls._temp_root: str = tempfile.mkdtemp(prefix='uvupd-')
+        cls.updater = UvUpdater()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """
+        Deletes the tests' lock-file directory.
+        """
+        shutil.rmtree(cls._temp_root, ignore_errors=True)
+
     def test_compare_uv_lock_files_happy_path_returns_diff(self) -> None:
         """
         Checks that compare_uv_lock_files() returns a dict indicating changes with unified diff text when files differ.
         """
-        updater = UvUpdater()
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            uv_lock_path = tmp_path / 'uv.lock'
-            log.debug(f'uv_lock_path: ``{uv_lock_path}``')
-            uv_lock_backup_path = tmp_path / 'uv.lock.bak'
-            log.debug(f'uv_lock_backup_path: ``{uv_lock_backup_path}``')
-
-            ## previous (backup) content
-            uv_lock_backup_path.write_text('version = 1\n[package]\nfoo = "1.0.0"\n')
-
-            ## current content (changed)
-            uv_lock_path.write_text('version = 1\n[package]\nfoo = "1.1.0"\nbar = "0.2.0"\n')
-
-            result = updater.compare_uv_lock_files(uv_lock_path, uv_lock_backup_path)
-
-            self.assertIsInstance(result, dict)
-            self.assertIn('changes', result)
-            self.assertIn('diff', result)
-            self.assertTrue(result['changes'])
-            diff_text: str = result['diff']
-            self.assertNotEqual(diff_text.strip(), '')
-            ## Expect unified diff headers to reference the two files
-            self.assertIn(str(uv_lock_backup_path), diff_text)
-            self.assertIn(str(uv_lock_path), diff_text)
-            ## Expect to see changed line indicators
-            self.assertIn('+bar = "0.2.0"', diff_text)
-            self.assertIn('-foo = "1.0.0"', diff_text)
-            self.assertIn('+foo = "1.1.0"', diff_text)
+        tmp_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        uv_lock_path = tmp_path / 'uv.lock'
+        log.debug(f'uv_lock_path: ``{uv_lock_path}``')
+        uv_lock_backup_path = tmp_path / 'uv.lock.bak'
+        log.debug(f'uv_lock_backup_path: ``{uv_lock_backup_path}``')
+
+        ## previous (backup) content
+        uv_lock_backup_path.write_text('version = 1\n[package]\nfoo = "1.0.0"\n')
+
+        ## current content (changed)
+        uv_lock_path.write_text('version = 1\n[package]\nfoo = "1.1.0"\nbar = "0.2.0"\n')
+
+        result = self.updater.compare_uv_lock_files(uv_lock_path, uv_lock_backup_path)
+
+        self.assertIsInstance(result, dict)
+        self.assertIn('changes', result)
+        self.assertIn('diff', result)
+        self.assertTrue(result['changes'])
+        diff_text: str = result['diff']
+        self.assertNotEqual(diff_text.strip(), '')
+        ## Expect unified diff headers to reference the two files
+        self.assertIn(str(uv_lock_backup_path), diff_text)
+        self.assertIn(str(uv_lock_path), diff_text)
+        ## Expect to see changed line indicators
+        self.assertIn('+bar = "0.2.0"', diff_text)
+        self.assertIn('-foo = "1.0.0"', diff_text)
+        self.assertIn('+foo = "1.1.0"', diff_text)
+
+    def test_compare_uv_lock_files_identical_returns_no_changes(self) -> None:
+        """
+        Checks that compare_uv_lock_files() returns no changes and an empty diff when the files are identical.
+        """
+        tmp_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        uv_lock_path = tmp_path / 'uv.lock'
+        uv_lock_backup_path = tmp_path / 'uv.lock.bak'
+        uv_lock_backup_path.write_text('version = 1\n[package]\nfoo = "1.0.0"\n')
+        uv_lock_path.write_text('version = 1\n[package]\nfoo = "1.0.0"\n')
+
+        result = self.updater.compare_uv_lock_files(uv_lock_path, uv_lock_backup_path)
+        self.assertFalse(result['changes'])
+        self.assertEqual(result['diff'], '')
+
+    def test_compare_uv_lock_files_diff_keeps_package_context(self) -> None:
+        """
+        Checks that the diff keeps the unchanged `[[package]]` / `name =` context lines around a version bump,
+        which check_for_django_update() needs to tell which package changed.
+        """
+        tmp_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        uv_lock_path = tmp_path / 'uv.lock'
+        uv_lock_backup_path = tmp_path / 'uv.lock.bak'
+        uv_lock_backup_path.write_text('[[package]]\nname = "django"\nversion = "4.2.20"\n')
+        uv_lock_path.write_text('[[package]]\nname = "django"\nversion = "4.2.27"\n')
+
+        result = self.updater.compare_uv_lock_files(uv_lock_path, uv_lock_backup_path)
+        self.assertIn(' [[package]]', result['diff'])
+        self.assertIn(' name = "django"', result['diff'])
+        self.assertTrue(check_for_django_update(result['diff']))
+
+    def test_compare_uv_lock_files_empty_backup_returns_diff(self) -> None:
+        """
+        Checks that an empty backup file is diffed as having no lines.
+        """
+        tmp_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        uv_lock_path = tmp_path / 'uv.lock'
+        uv_lock_backup_path = tmp_path / 'uv.lock.bak'
+        uv_lock_backup_path.write_bytes(b'')
+        uv_lock_path.write_text('version = 1\r\n')
+
+        result = self.updater.compare_uv_lock_files(uv_lock_path, uv_lock_backup_path)
+        self.assertTrue(result['changes'])
+        self.assertIn('+version = 1\n', result['diff'])  # line-ending stripped before diffing
 
     def test_compare_uv_lock_files_failure_returns_empty_result(self) -> None:
         """
         Checks that compare_uv_lock_files() gracefully returns a dict with no changes and empty diff on exception (e.g., missing file).
         """
-        updater = UvUpdater()
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            uv_lock_path = tmp_path / 'uv.lock'
-            # write only the current file; provide a non-existent backup path
-            uv_lock_path.write_text('content\n')
-            missing_backup = tmp_path / 'does_not_exist.lock.bak'
-
-            result = updater.compare_uv_lock_files(uv_lock_path, missing_backup)
-            self.assertIsInstance(result, dict)
-            self.assertFalse(result.get('changes', True))
-            self.assertEqual(result.get('diff', None), '')
+        tmp_path = Path(tempfile.mkdtemp(dir=self._temp_root))
+        uv_lock_path = tmp_path / 'uv.lock'
+        # write only the current file; provide a non-existent backup path
+        uv_lock_path.write_text('content\n')
+        missing_backup = tmp_path / 'does_not_exist.lock.bak'
+
+        result = self.updater.compare_uv_lock_files(uv_lock_path, missing_backup)
+        self.assertIsInstance(result, dict)
+        self.assertFalse(result.get('changes', True))
+        self.assertEqual(result.get('diff', None), '')
+
+    def test_make_sync_command_groups(self) -> None:
+        """
+        Checks that make_sync_command() maps each environment-type to its `--group`, and rejects unknown types.
+        """
+        uv_path = Path('/usr/local/bin/uv')
+        for environment_type in ('local', 'staging', 'production'):
+            with self.subTest(environment_type=environment_type):
+                command = self.updater.make_sync_command(uv_path, environment_type, '--upgrade')
+                self.assertEqual(
+                    [str(uv_path), 'sync', '--no-active', '--upgrade', '--group', environment_type],
+                    command,
+                )
+        with self.assertRaises(Exception):
+            self.updater.make_sync_command(uv_path, 'unknown', '--upgrade')
 
 
 if __name__ == '__main__':